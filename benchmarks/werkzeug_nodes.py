@@ -0,0 +1,51 @@
+"""
+Measures the memory allocated by node wrappers while querying a large page with the werkzeug
+driver. ::
+
+    python benchmarks/werkzeug_nodes.py
+"""
+
+from timeit import default_timer
+import tracemalloc
+
+import capybara
+from capybara.session import Session
+from capybara.utils import encode_string
+
+
+ROWS = 5000
+
+PAGE = "<html><body><ul>{}</ul></body></html>".format(
+    "".join("<li class='row'>Row {}</li>".format(i) for i in range(ROWS)))
+
+
+def app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/html")])
+    return [encode_string(PAGE)]
+
+
+def main():
+    session = Session("werkzeug", app)
+    session.visit("/")
+
+    # Parse the page and warm the query caches before measuring.
+    session.find_all("css", "li.row")
+
+    tracemalloc.start()
+    start = default_timer()
+
+    for _ in range(3):
+        assert len(session.find_all("css", "li.row", text="Row 4999")) == 1
+
+    elapsed = default_timer() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("rows: {}".format(ROWS))
+    print("time: {:.3f}s".format(elapsed))
+    print("retained: {:.1f} KiB".format(current / 1024.0))
+    print("peak: {:.1f} KiB".format(peak / 1024.0))
+
+
+if __name__ == "__main__":
+    main()
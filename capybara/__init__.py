@@ -43,6 +43,10 @@ exact = False
 default_max_wait_time = 2
 """ int: The maximum number of seconds to wait for asynchronous processes to finish. """
 
+dom_cache_size = 0
+""" int: The maximum total size, in bytes of HTML source, of parsed documents to keep for reuse when
+identical HTML is loaded again. Defaults to 0, which disables the cache. """
+
 default_selector = "css"
 """ str: The name of the default selector used to find elements. """
 
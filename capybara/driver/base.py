@@ -9,6 +9,11 @@ class Base(object):
         """ bool: Whether this driver needs to communicate with a real HTTP server. """
         return False
 
+    @property
+    def supports_xpath_variables(self):
+        """ bool: Whether this driver can evaluate XPath queries that reference variables. """
+        return False
+
     @property
     def current_url(self):
         """ str: The current URL. """
@@ -233,12 +238,14 @@ class Base(object):
 
         raise NotImplementedError()
 
-    def _find_xpath(self, query):
+    def _find_xpath(self, query, **variables):
         """
         A private method for finding nodes matching a given XPath query.
 
         Args:
             query (str): The XPath query to match.
+            **variables: Values for the variables referenced by the query. Only given if the
+                driver :attr:`supports_xpath_variables`.
 
         Returns:
             List[driver.Node]: A list of matching nodes found by the driver.
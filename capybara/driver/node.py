@@ -7,6 +7,8 @@ class Node(object):
         native (object): The native element object returned by the driver's browser.
     """
 
+    __slots__ = ("driver", "native")
+
     def __init__(self, driver, native):
         self.driver = driver
         self.native = native
@@ -1,8 +1,23 @@
+from copy import deepcopy
 from cssselect import HTMLTranslator
+from hashlib import sha1
 from lxml import etree
 import re
+from xpath import dsl as x
+from xpath.renderer import to_xpath
 
-from capybara.utils import inner_content
+import capybara
+from capybara.utils import LRUCache, encode_string, inner_content
+
+
+compiled_queries = LRUCache(maxsize=1024)
+""" LRUCache: A process-wide cache of compiled lxml XPath queries, keyed by selector text. """
+
+parsed_documents = LRUCache(maxsize=0, sizeof=lambda entry: entry[1])
+"""
+LRUCache: A process-wide cache of pristine parsed documents, keyed by a hash of their source and
+sized by the length of their source in bytes. Bounded by :data:`capybara.dom_cache_size`.
+"""
 
 
 class HTML(object):
@@ -10,20 +25,100 @@ class HTML(object):
         if not source:
             source = "<html/>"
 
-        parser = etree.HTMLParser(encoding="utf-8")
-        tree = etree.HTML(source, parser=parser)
-
-        for element in tree.xpath("//textarea"):
-            content = inner_content(element)
-            content = re.sub("\A\n", "", content)
-            for child in element.getchildren():
-                element.remove(child)
-            element.text = content
+        self.tree = parse_html(source, _parse_document, namespace="document")
 
-        self.tree = tree
+        self.nodes = {}
+        # Dict[Tuple[type, lxml.etree.Element], object]: Driver nodes wrapping elements of this
+        # document, keyed by node type and element.
 
     def css(self, css):
-        return etree.XPath(HTMLTranslator().css_to_xpath(css))(self.tree)
+        return compile_css(css, include_self=True)(self.tree)
+
+    def xpath(self, xpath, **variables):
+        return compile_xpath(xpath)(self.tree, **variables)
+
+
+def parse_html(source, parse, namespace=None):
+    """
+    Returns the tree parsed from the given HTML source, reusing a previously parsed tree for
+    identical source if :data:`capybara.dom_cache_size` permits.
+
+    Cached trees are kept pristine: every call returns a tree which may be freely mutated.
+
+    Args:
+        source (bytes | str): The HTML source to parse.
+        parse (Callable[[bytes | str], lxml.etree.Element]): A function that parses the source.
+        namespace (str, optional): A name distinguishing trees parsed with different functions.
+
+    Returns:
+        lxml.etree.Element: The root of the parsed tree.
+    """
+
+    if not capybara.dom_cache_size:
+        return parse(source)
+
+    parsed_documents.maxsize = capybara.dom_cache_size
+
+    data = encode_string(source)
+    key = (namespace, sha1(data).hexdigest())
+
+    entry = parsed_documents.get(key)
+    if entry is None:
+        tree = parse(source)
+        parsed_documents.set(key, (deepcopy(tree), len(data)))
+        return tree
+    else:
+        return deepcopy(entry[0])
+
+
+def compile_css(css, include_self=False):
+    """
+    Returns a compiled XPath query equivalent to the given CSS selector.
+
+    Args:
+        css (str): The CSS selector to compile.
+        include_self (bool, optional): Whether the node against which the query is evaluated
+            may itself match. Defaults to False.
+
+    Returns:
+        lxml.etree.XPath: The compiled query.
+    """
+
+    def compile():
+        if include_self:
+            return etree.XPath(_translator.css_to_xpath(css))
+        else:
+            return etree.XPath(to_xpath(x.css(css)))
+
+    return compiled_queries.fetch(("css", css, include_self), compile)
+
+
+def compile_xpath(xpath):
+    """
+    Returns the given XPath query, compiled.
+
+    Args:
+        xpath (str): The XPath query to compile.
+
+    Returns:
+        lxml.etree.XPath: The compiled query.
+    """
+
+    return compiled_queries.fetch(("xpath", xpath), lambda: etree.XPath(xpath))
+
+
+def _parse_document(source):
+    parser = etree.HTMLParser(encoding="utf-8")
+    tree = etree.HTML(source, parser=parser)
+
+    for element in tree.xpath("//textarea"):
+        content = inner_content(element)
+        content = re.sub("\A\n", "", content)
+        for child in element.getchildren():
+            element.remove(child)
+        element.text = content
+
+    return tree
+
 
-    def xpath(self, xpath):
-        return self.tree.xpath(xpath)
+_translator = HTMLTranslator()
@@ -13,6 +13,8 @@ class ActionsMixin(object):
     :data:`capybara.default_max_wait_time`.
     """
 
+    __slots__ = ()
+
     def attach_file(self, locator_or_path, path=None, **kwargs):
         """
         Find a file field on the page and attach a file given its path. The file field can be found
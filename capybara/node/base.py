@@ -33,6 +33,8 @@ class Base(FindersMixin, ActionsMixin, MatchersMixin, object):
         base (driver.Node): The underlying driver node.
     """
 
+    __slots__ = ("session", "base", "allow_reload", "_contexts")
+
     def __init__(self, session, base):
         self.session = session
         self.base = base
@@ -197,8 +199,12 @@ class Base(FindersMixin, ActionsMixin, MatchersMixin, object):
     def _find_css(self, css):
         return self.base._find_css(css)
 
-    def _find_xpath(self, xpath):
-        return self.base._find_xpath(xpath)
+    @property
+    def _supports_xpath_variables(self):
+        return self.session.driver.supports_xpath_variables
+
+    def _find_xpath(self, xpath, **variables):
+        return self.base._find_xpath(xpath, **variables)
 
 
 def synchronize(func):
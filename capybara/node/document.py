@@ -8,6 +8,8 @@ class Document(DocumentMatchersMixin, Base):
     performed on the entire document.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         return "<capybara.node.document.Document>"
 
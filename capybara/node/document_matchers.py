@@ -3,6 +3,8 @@ from capybara.queries.title_query import TitleQuery
 
 
 class DocumentMatchersMixin(object):
+    __slots__ = ()
+
     def assert_title(self, title, **kwargs):
         """
         Asserts that the page has the given title.
@@ -21,6 +21,8 @@ class Element(Base):
         bar["title"]
     """
 
+    __slots__ = ("query_scope", "query", "_scope")
+
     def __init__(self, session, base, query_scope, query):
         super(type(self), self).__init__(session, base)
         self.query_scope = query_scope
@@ -13,6 +13,8 @@ class FindersMixin(object):
     :data:`capybara.default_max_wait_time` and defaults to 2 seconds.
     """
 
+    __slots__ = ()
+
     def find(self, *args, **kwargs):
         """
         Find an :class:`Element` based on the given arguments. ``find`` will raise an error if the
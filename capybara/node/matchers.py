@@ -25,6 +25,8 @@ def predicate(func):
 
 
 class MatchersMixin(object):
+    __slots__ = ()
+
     @predicate
     def has_selector(self, *args, **kwargs):
         """
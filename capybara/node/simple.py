@@ -1,8 +1,7 @@
 import re
-from xpath import dsl as x
-from xpath.renderer import to_xpath
 
 from capybara.compat import bytes_, str_
+from capybara.html import compile_css, compile_xpath, parse_html
 from capybara.node.document_matchers import DocumentMatchersMixin
 from capybara.node.finders import FindersMixin
 from capybara.node.matchers import MatchersMixin
@@ -17,14 +16,20 @@ class Simple(FindersMixin, MatchersMixin, DocumentMatchersMixin, object):
 
     It is useful in that it does not require a session, an application, or a driver, but can still
     use Capybara's finders and matchers on any string that contains HTML.
+
+    Args:
+        native (str | lxml.etree.Element): An HTML fragment or document, or a parsed element.
+        nodes (Dict[lxml.etree.Element, Simple], optional): The nodes already wrapping elements of
+            the same document, with which any nodes found within this one should be shared.
     """
 
-    def __init__(self, native):
+    __slots__ = ("native", "_nodes")
+
+    def __init__(self, native, nodes=None):
         if isinstance(native, (bytes_, str_)):
-            from lxml import etree
-            native = decode_bytes(native)
-            native = etree.HTML(native)
+            native = parse_html(native, _parse_string, namespace="string")
         self.native = native
+        self._nodes = nodes
 
     def __getitem__(self, name):
         """
@@ -147,13 +152,41 @@ class Simple(FindersMixin, MatchersMixin, DocumentMatchersMixin, object):
 
         return True
 
-    def _find_xpath(self, xpath):
-        return self.native.xpath(xpath)
+    @property
+    def _supports_xpath_variables(self):
+        return True
+
+    def _find_xpath(self, xpath, **variables):
+        return compile_xpath(xpath)(self.native, **variables)
 
     def _find_css(self, css):
-        xpath = to_xpath(x.css(css))
-        return self._find_xpath(xpath)
+        return compile_css(css)(self.native)
+
+    def _wrap(self, native):
+        """
+        Returns the node for the given element of this document, reusing an existing one if
+        possible.
+
+        Args:
+            native (lxml.etree.Element): The element to wrap.
+
+        Returns:
+            Simple: The node for the element.
+        """
+
+        if self._nodes is None:
+            self._nodes = {self.native: self}
+
+        node = self._nodes.get(native)
+        if node is None:
+            node = self._nodes[native] = Simple(native, self._nodes)
+        return node
 
 
 def _get_option_value(option):
     return option.get("value") or inner_content(option)
+
+
+def _parse_string(source):
+    from lxml import etree
+    return etree.HTML(decode_bytes(source))
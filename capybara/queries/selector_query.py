@@ -1,6 +1,7 @@
 from functools import reduce
 import re
 from xpath.expression import AbstractExpression
+from xpath.literal import Literal
 from xpath.renderer import to_xpath
 
 import capybara
@@ -9,11 +10,19 @@ from capybara.helpers import desc, normalize_text, toregex
 from capybara.queries.base_query import BaseQuery
 from capybara.result import Result
 from capybara.selector import selectors
-from capybara.utils import isregex
+from capybara.utils import LRUCache, decode_bytes, isregex
 
 
 VALID_MATCH = ["first", "one", "prefer_exact", "smart"]
 
+_xpaths = LRUCache(maxsize=1024)
+# LRUCache: Rendered XPath queries keyed by selector, locator, expression filter options, exactness,
+# and :data:`capybara.enable_aria_label`.
+
+_xpath_templates = LRUCache(maxsize=256)
+# LRUCache: Rendered XPath queries for parameterized selectors, with locators and filter values
+# given as XPath variables.
+
 
 class SelectorQuery(BaseQuery):
     """
@@ -72,6 +81,8 @@ class SelectorQuery(BaseQuery):
             "visible": visible,
             "wait": wait}
         self.filter_options = filter_options
+        self._xpaths = {}
+        self._parameterized_xpaths = {}
 
         assert self.match in VALID_MATCH, \
             "invalid option {match} for match, should be one of {valid_values}".format(
@@ -169,12 +180,16 @@ class SelectorQuery(BaseQuery):
 
         exact = exact if exact is not None else self.exact
 
-        if isinstance(self.expression, AbstractExpression):
-            expression = self._apply_expression_filters(self.expression)
+        memo_key = (exact, capybara.enable_aria_label)
+        if memo_key not in self._xpaths:
+            cache_key = self._xpath_cache_key(exact)
+            if cache_key is None:
+                xpath = self._render_xpath(exact)
+            else:
+                xpath = _xpaths.fetch(cache_key, lambda: self._render_xpath(exact))
+            self._xpaths[memo_key] = xpath
 
-            return to_xpath(expression, exact=exact)
-        else:
-            return str_(self.expression)
+        return self._xpaths[memo_key]
 
     def resolve_for(self, node, exact=None):
         """
@@ -190,12 +205,14 @@ class SelectorQuery(BaseQuery):
 
         from capybara.driver.node import Node
         from capybara.node.element import Element
-        from capybara.node.simple import Simple
 
         @node.synchronize
         def resolve():
             if self.selector.format == "css":
                 children = node._find_css(self.css())
+            elif node._supports_xpath_variables:
+                xpath, variables = self._parameterized_xpath(exact)
+                children = node._find_xpath(xpath, **variables)
             else:
                 children = node._find_xpath(self.xpath(exact))
 
@@ -203,7 +220,7 @@ class SelectorQuery(BaseQuery):
                 if isinstance(child, Node):
                     return Element(node.session, child, node, self)
                 else:
-                    return Simple(child)
+                    return node._wrap(child)
 
             children = [wrap(child) for child in children]
 
@@ -280,6 +297,103 @@ class SelectorQuery(BaseQuery):
 
         return reduce(apply_filter, iter(self._expression_filters.items()), expr)
 
+    def _render_xpath(self, exact):
+        if isinstance(self.expression, AbstractExpression):
+            expression = self._apply_expression_filters(self.expression)
+
+            return to_xpath(expression, exact=exact)
+        else:
+            return str_(self.expression)
+
+    def _xpath_cache_key(self, exact):
+        """
+        Returns a key identifying the XPath query for this selector across query instances, or
+        ``None`` if the locator or expression filter options cannot be safely compared.
+
+        Args:
+            exact (bool): Whether to exactly match text.
+
+        Returns:
+            Tuple | None: The cache key.
+        """
+
+        try:
+            filter_options = tuple(sorted(
+                (name, _cache_value(value))
+                for name, value in iter(self.filter_options.items())
+                if name in self._expression_filters))
+
+            return (self.selector, _cache_value(self.locator), filter_options, exact,
+                    capybara.enable_aria_label)
+        except TypeError:
+            return None
+
+    def _parameterized_xpath(self, exact=None):
+        """
+        Returns the XPath query for this selector with the locator and any parameterized filter
+        values referenced as XPath variables, so that the same query may be reused (and compiled
+        only once) for any locator.
+
+        Args:
+            exact (bool, optional): Whether to exactly match text.
+
+        Returns:
+            Tuple[str, Dict[str, str]]: The XPath query and the values of its variables.
+        """
+
+        exact = exact if exact is not None else self.exact
+
+        memo_key = (exact, capybara.enable_aria_label)
+        if memo_key not in self._parameterized_xpaths:
+            self._parameterized_xpaths[memo_key] = self._render_parameterized_xpath(exact)
+
+        return self._parameterized_xpaths[memo_key]
+
+    def _render_parameterized_xpath(self, exact):
+        if not self.selector.parameterized or not isinstance(self.expression, AbstractExpression):
+            return self.xpath(exact), {}
+
+        if self.locator and not isinstance(self.locator, (bytes_, str_)):
+            return self.xpath(exact), {}
+
+        variables = {}
+        if self.locator:
+            variables["locator"] = decode_bytes(self.locator)
+
+        filters = []
+        for name, ef in iter(self._expression_filters.items()):
+            if name in self.filter_options:
+                value = self.filter_options[name]
+            elif ef.has_default:
+                value = ef.default
+            else:
+                continue
+
+            if ef.parameterized and isinstance(value, (bytes_, str_)) and not ef.skip(value):
+                variables[name] = decode_bytes(value)
+                filters.append((name, Literal("$" + name)))
+            else:
+                filters.append((name, value))
+
+        try:
+            key = (self.selector, bool(self.locator), exact, capybara.enable_aria_label,
+                   tuple((name, Literal if isinstance(value, Literal) else _cache_value(value))
+                         for name, value in filters))
+        except TypeError:
+            return self.xpath(exact), {}
+
+        def render():
+            expression = self.selector(Literal("$locator") if self.locator else self.locator)
+            for name, value in filters:
+                ef = self._expression_filters[name]
+                if isinstance(value, Literal):
+                    expression = ef.func(expression, value)
+                else:
+                    expression = ef.apply_filter(expression, value)
+            return to_xpath(expression, exact=exact)
+
+        return _xpath_templates.fetch(key, render), variables
+
     @property
     def _expression_filters(self):
         return self.selector.expression_filters
@@ -287,3 +401,25 @@ class SelectorQuery(BaseQuery):
     @property
     def _node_filters(self):
         return self.selector.node_filters
+
+
+def _cache_value(value):
+    """
+    Returns a representation of the given query option value which is safe to use in a cache key.
+
+    Args:
+        value (object): The option value.
+
+    Returns:
+        Hashable: The representation of the value.
+
+    Raises:
+        TypeError: If the value is of a type which cannot be safely compared.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, bytes_, str_)):
+        return (type(value), value)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_cache_value(item) for item in value))
+
+    raise TypeError("unsupported cache value: {}".format(repr(value)))
@@ -20,6 +20,8 @@ with add_selector("xpath") as s:
     s.xpath = lambda xpath: xpath
 
 with add_selector("id") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(id):
         return x.descendant()[x.attr("id") == id]
@@ -37,11 +39,11 @@ with add_filter_set("field") as fs:
     def id(node, value):
         return node["id"] == value
 
-    @fs.expression_filter("name")
+    @fs.expression_filter("name", parameterized=True)
     def name(expr, value):
         return expr[x.attr("name") == value]
 
-    @fs.expression_filter("placeholder")
+    @fs.expression_filter("placeholder", parameterized=True)
     def placeholder(expr, value):
         return expr[x.attr("placeholder") == value]
 
@@ -70,6 +72,8 @@ with add_filter_set("field") as fs:
         return description
 
 with add_selector("button") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         input_button_expr = x.descendant("input")[
@@ -109,6 +113,8 @@ with add_selector("button") as s:
         return description
 
 with add_selector("checkbox") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("input")[x.attr("type").equals("checkbox")]
@@ -118,6 +124,8 @@ with add_selector("checkbox") as s:
     s.filter_set("field")
 
 with add_selector("field") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("input", "select", "textarea")[
@@ -149,6 +157,8 @@ with add_selector("field") as s:
         return description
 
 with add_selector("fieldset") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("fieldset")
@@ -160,6 +170,7 @@ with add_selector("fieldset") as s:
 
 with add_selector("file_field") as s:
     s.label = "file field"
+    s.parameterized = True
 
     @s.xpath
     def xpath(locator):
@@ -171,6 +182,7 @@ with add_selector("file_field") as s:
 
 with add_selector("fillable_field") as s:
     s.label = "field"
+    s.parameterized = True
 
     @s.xpath
     def xpath(locator):
@@ -196,6 +208,8 @@ with add_selector("fillable_field") as s:
         return description
 
 with add_selector("frame") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("frame") + x.descendant("iframe")
@@ -203,7 +217,7 @@ with add_selector("frame") as s:
             expr = expr[x.attr("id").equals(locator) | x.attr("name").equals(locator)]
         return expr
 
-    @s.expression_filter("name")
+    @s.expression_filter("name", parameterized=True)
     def name(expr, value):
         return expr[x.attr("name").equals(value)]
 
@@ -235,6 +249,8 @@ with add_selector("label") as s:
         return description
 
 with add_selector("link") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("a")[x.attr("href")]
@@ -273,6 +289,7 @@ with add_selector("link") as s:
 
 with add_selector("link_or_button") as s:
     s.label = "link or button"
+    s.parameterized = True
 
     @s.xpath
     def xpath(locator):
@@ -292,6 +309,8 @@ with add_selector("link_or_button") as s:
         return description
 
 with add_selector("option") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("option")
@@ -301,6 +320,7 @@ with add_selector("option") as s:
 
 with add_selector("radio_button") as s:
     s.label = "radio button"
+    s.parameterized = True
 
     @s.xpath
     def xpath(locator):
@@ -312,6 +332,7 @@ with add_selector("radio_button") as s:
 
 with add_selector("select") as s:
     s.label = "select box"
+    s.parameterized = True
 
     @s.xpath
     def xpath(locator):
@@ -368,6 +389,8 @@ with add_selector("select") as s:
         return description
 
 with add_selector("table") as s:
+    s.parameterized = True
+
     @s.xpath
     def xpath(locator):
         expr = x.descendant("table")
@@ -4,6 +4,23 @@ from capybara.selector.abstract_filter import AbstractFilter
 
 
 class ExpressionFilter(AbstractFilter):
+    """
+    A rule that narrows a selector's XPath expression.
+
+    Args:
+        name (str): The name of this filter.
+        func (Callable[[AbstractExpression, Any], AbstractExpression]): A function that filters a
+            given expression by a desired value.
+        parameterized (bool, optional): Whether the function only uses the value as a value, such
+            that string values may be given to the filtered query as an XPath variable. Defaults
+            to False.
+        **kwargs: Arbitrary keyword arguments for :class:`AbstractFilter`.
+    """
+
+    def __init__(self, name, func, parameterized=False, **kwargs):
+        super(ExpressionFilter, self).__init__(name, func, **kwargs)
+        self.parameterized = parameterized
+
     def apply_filter(self, expr, value):
         """
         Returns the given expression filtered by the given value.
@@ -25,9 +25,13 @@ class Selector(object):
             locator string.
         filters (Dict[str, AbstractFilter]): A dictionary of filters this selector should use to
             identify matching elements. Defaults to {}.
+        parameterized (bool, optional): Whether the XPath query generation function only uses the
+            locator as a value, such that the locator may be given to the generated query as an
+            XPath variable. Defaults to False.
     """
 
-    def __init__(self, name, label=None, descriptions=None, css=None, xpath=None, filters=None):
+    def __init__(self, name, label=None, descriptions=None, css=None, xpath=None, filters=None,
+                 parameterized=False):
         self.name = name
         self.label = label
         self.descriptions = descriptions or []
@@ -35,6 +39,7 @@ class Selector(object):
         self.xpath = xpath
         self.format = "xpath" if xpath else "css"
         self.filters = filters or {}
+        self.parameterized = parameterized
 
     def __call__(self, locator):
         assert self.format, "selector has no format"
@@ -81,6 +86,7 @@ class SelectorFactory(object):
     def __init__(self, name):
         self.name = name
         self.label = None
+        self.parameterized = False
         self.descriptions = []
         self.func = None
         self.format = None
@@ -175,7 +181,8 @@ class SelectorFactory(object):
         kwargs = {
             'label': self.label,
             'descriptions': self.descriptions,
-            'filters': self.filters}
+            'filters': self.filters,
+            'parameterized': self.parameterized}
         if self.format == "xpath":
             kwargs['xpath'] = self.func
         if self.format == "css":
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from socket import socket
 from threading import Lock
 
@@ -55,6 +56,122 @@ class Counter(object):
             self._value -= 1
 
 
+class LRUCache(object):
+    """
+    A thread-safe mapping that holds at most a given number of entries, evicting the least
+    recently used entry when full.
+
+    Args:
+        maxsize (int): The maximum number of entries to hold, or the maximum total size of the
+            entries if ``sizeof`` is given.
+        sizeof (Callable[[object], int], optional): A function that returns the size of a given
+            value. Defaults to counting each value as 1.
+    """
+
+    def __init__(self, maxsize, sizeof=None):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sizeof = sizeof or (lambda value: 1)
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Returns the value for the given key, marking it as recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (object, optional): The value to return if the key is missing.
+
+        Returns:
+            object: The cached value, or the default.
+        """
+
+        with self._lock:
+            value = self._entries.pop(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+            self._entries[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Stores the given value, evicting the least recently used entries if needed.
+
+        Args:
+            key (Hashable): The key under which to store the value.
+            value (object): The value to store.
+        """
+
+        with self._lock:
+            previous = self._entries.pop(key, _missing)
+            if previous is not _missing:
+                self._size -= self._sizeof(previous)
+            self._entries[key] = value
+            self._size += self._sizeof(value)
+            while self._entries and self._size > max(self.maxsize, 0):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= self._sizeof(evicted)
+                self.evictions += 1
+
+    def fetch(self, key, func):
+        """
+        Returns the value for the given key, computing and storing it with the given function if
+        it is missing.
+
+        Args:
+            key (Hashable): The key to look up.
+            func (Callable[[], object]): A function that computes the value.
+
+        Returns:
+            object: The cached or computed value.
+        """
+
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = func()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        """ Removes all entries and resets the counters. """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def size(self):
+        """ int: The total size of the entries. """
+        return self._size
+
+    @property
+    def stats(self):
+        """ Dict[str, int | float]: The hit, miss, and eviction counts, along with the size. """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self._size,
+            "maxsize": self.maxsize}
+
+
 def decode_bytes(value):
     """ str: Decodes the given byte sequence. """
     return value.decode("utf-8") if isbytes(value) else value
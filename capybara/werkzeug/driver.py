@@ -19,6 +19,10 @@ class Driver(Base):
             self._browser = Browser(self)
         return self._browser
 
+    @property
+    def supports_xpath_variables(self):
+        return True
+
     @property
     def current_url(self):
         return self.browser.current_url
@@ -48,9 +52,9 @@ class Driver(Base):
         self._browser = None
 
     def _find_css(self, css):
-        elements = self.browser.dom.css(css)
-        return [Node(self, element) for element in elements]
+        dom = self.browser.dom
+        return [Node.wrap(self, element, dom.nodes) for element in dom.css(css)]
 
-    def _find_xpath(self, xpath):
-        elements = self.browser.dom.xpath(xpath)
-        return [Node(self, element) for element in elements]
+    def _find_xpath(self, xpath, **variables):
+        dom = self.browser.dom
+        return [Node.wrap(self, element, dom.nodes) for element in dom.xpath(xpath, **variables)]
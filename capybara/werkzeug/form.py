@@ -9,6 +9,8 @@ from capybara.werkzeug.node import Node
 
 
 class Form(Node):
+    __slots__ = ()
+
     def params(self, button):
         params = MultiDict()
 
@@ -5,11 +5,54 @@ from xpath.renderer import to_xpath
 from capybara.driver.node import Node as Base
 from capybara.exceptions import ReadOnlyElementError, UnselectNotAllowed
 from capybara.helpers import normalize_whitespace
+from capybara.html import compile_css, compile_xpath
 from capybara.node.simple import Simple
 from capybara.utils import inner_text
 
 
 class Node(Base):
+    """
+    A node of a document parsed for the werkzeug driver.
+
+    Args:
+        driver (Driver): The driver used to find this node.
+        native (lxml.etree.Element): The parsed element.
+        nodes (Dict[Tuple[type, lxml.etree.Element], Node], optional): The nodes already wrapping
+            elements of the same document, with which any nodes found within this one should be
+            shared.
+    """
+
+    __slots__ = ("_nodes", "_simple")
+
+    def __init__(self, driver, native, nodes=None):
+        super(Node, self).__init__(driver, native)
+        self._nodes = nodes
+        self._simple = None
+
+    @classmethod
+    def wrap(cls, driver, native, nodes=None):
+        """
+        Returns the node for the given element, reusing an existing one if possible.
+
+        Args:
+            driver (Driver): The driver used to find the element.
+            native (lxml.etree.Element): The element to wrap.
+            nodes (Dict[Tuple[type, lxml.etree.Element], Node], optional): The nodes already
+                wrapping elements of the same document.
+
+        Returns:
+            Node: The node for the element.
+        """
+
+        if nodes is None:
+            return cls(driver, native)
+
+        key = (cls, native)
+        node = nodes.get(key)
+        if node is None:
+            node = nodes[key] = cls(driver, native, nodes)
+        return node
+
     @property
     def tag_name(self):
         return self.native.tag
@@ -38,7 +81,8 @@ class Node(Base):
             parts = (
                 [self.native.text] +
                 list(chain(*(
-                    [Node(self.driver, c).unnormalized_text(check_ancestor_visibility=False),
+                    [Node.wrap(self.driver, c, self._nodes).unnormalized_text(
+                        check_ancestor_visibility=False),
                      c.tail]
                     for c in self.native.getchildren()))))
             return "".join(filter(None, parts))
@@ -94,7 +138,7 @@ class Node(Base):
             associated_form = self._form
             if associated_form is not None:
                 from capybara.werkzeug.form import Form
-                Form(self.driver, associated_form).submit(self)
+                Form.wrap(self.driver, associated_form, self._nodes).submit(self)
         elif self.tag_name == "input" and self["type"] in ["checkbox", "radio"]:
             self.set(not self.checked)
         elif self.tag_name == "label":
@@ -157,7 +201,9 @@ class Node(Base):
 
     @property
     def _string_node(self):
-        return Simple(self.native)
+        if self._simple is None:
+            self._simple = Simple(self.native)
+        return self._simple
 
     @property
     def _form(self):
@@ -168,12 +214,14 @@ class Node(Base):
         return elements[0] if elements else None
 
     def _find_css(self, css):
-        return self._find_xpath(to_xpath(x.css(css)))
+        cls = type(self)
+        elements = compile_css(css)(self.native)
+        return [cls.wrap(self.driver, element, self._nodes) for element in elements]
 
-    def _find_xpath(self, xpath):
+    def _find_xpath(self, xpath, **variables):
         cls = type(self)
-        elements = self.native.xpath(xpath)
-        return [cls(self.driver, element) for element in elements]
+        elements = compile_xpath(xpath)(self.native, **variables)
+        return [cls.wrap(self.driver, element, self._nodes) for element in elements]
 
     def _set_radio(self, value):
         other_radios = self.native.xpath(to_xpath(
@@ -0,0 +1,87 @@
+import pytest
+
+import capybara
+from capybara.html import HTML, compile_css, compile_xpath, compiled_queries, parsed_documents
+from capybara.utils import LRUCache
+
+
+class TestLRUCache:
+    @pytest.fixture
+    def cache(self):
+        return LRUCache(maxsize=2)
+
+    def test_counts_hits_and_misses(self, cache):
+        assert cache.get("foo") is None
+        cache.set("foo", 1)
+        assert cache.get("foo") == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_evicts_the_least_recently_used_entry(self, cache):
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        cache.get("foo")
+        cache.set("baz", 3)
+        assert "foo" in cache
+        assert "bar" not in cache
+        assert cache.stats["evictions"] == 1
+        assert cache.stats["size"] == 2
+        assert cache.stats["entries"] == 2
+
+
+class TestCompiledQueries:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        compiled_queries.clear()
+
+    @pytest.fixture
+    def html(self):
+        return HTML("<html><body><p id='foo'>Foo</p><p>Bar</p></body></html>")
+
+    def test_reuses_compiled_xpath_queries(self, html):
+        assert compile_xpath("//p") is compile_xpath("//p")
+        assert len(html.xpath("//p")) == 2
+        assert compiled_queries.stats["misses"] == 1
+        assert compiled_queries.stats["hits"] == 2
+
+    def test_reuses_compiled_css_queries(self, html):
+        assert compile_css("p") is compile_css("p")
+        assert len(html.css("p#foo")) == 1
+        assert len(html.css("p#foo")) == 1
+        assert compiled_queries.stats["misses"] == 2
+        assert compiled_queries.stats["hits"] == 2
+
+    def test_matches_the_root_element_with_css(self, html):
+        assert len(html.css("html")) == 1
+
+
+class TestParsedDocuments:
+    @pytest.fixture(autouse=True)
+    def setup_cache(self):
+        original_dom_cache_size = capybara.dom_cache_size
+        parsed_documents.clear()
+        try:
+            capybara.dom_cache_size = 1024 * 1024
+            yield
+        finally:
+            capybara.dom_cache_size = original_dom_cache_size
+            parsed_documents.clear()
+
+    def test_reuses_documents_parsed_from_identical_source(self):
+        HTML("<html><body><p>Foo</p></body></html>")
+        HTML("<html><body><p>Foo</p></body></html>")
+        assert parsed_documents.stats["hits"] == 1
+        assert parsed_documents.stats["misses"] == 1
+        assert parsed_documents.stats["size"] == len("<html><body><p>Foo</p></body></html>")
+
+    def test_does_not_leak_mutations_between_documents(self):
+        html = HTML("<html><body><input value='foo'/></body></html>")
+        html.xpath("//input")[0].set("value", "bar")
+        html = HTML("<html><body><input value='foo'/></body></html>")
+        assert html.xpath("//input")[0].get("value") == "foo"
+
+    def test_does_not_cache_when_disabled(self):
+        capybara.dom_cache_size = 0
+        HTML("<html><body><p>Foo</p></body></html>")
+        HTML("<html><body><p>Foo</p></body></html>")
+        assert parsed_documents.stats["entries"] == 0
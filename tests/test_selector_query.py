@@ -0,0 +1,73 @@
+import pytest
+
+import capybara
+from capybara.queries.selector_query import SelectorQuery
+
+
+class TestParameterizedXPath:
+    @pytest.fixture
+    def string(self):
+        return capybara.string("""
+            <form>
+              <label for="email">Email</label>
+              <input type="text" id="email" name="email" placeholder="it's you"/>
+              <label for="name">Name</label>
+              <input type="text" id="name" name="name"/>
+            </form>
+        """)
+
+    def test_references_the_locator_as_a_variable(self):
+        xpath, variables = SelectorQuery("field", "Email")._parameterized_xpath()
+        assert "$locator" in xpath
+        assert "Email" not in xpath
+        assert variables == {"locator": "Email"}
+
+    def test_reuses_the_query_for_different_locators(self):
+        xpath1, _ = SelectorQuery("field", "Email")._parameterized_xpath()
+        xpath2, _ = SelectorQuery("field", "Name")._parameterized_xpath()
+        assert xpath1 is xpath2
+
+    def test_references_parameterized_filter_values_as_variables(self):
+        xpath, variables = SelectorQuery(
+            "field", "Email", name="email")._parameterized_xpath()
+        assert "$name" in xpath
+        assert variables == {"locator": "Email", "name": "email"}
+
+    def test_renders_literal_queries_for_unparameterized_selectors(self):
+        xpath, variables = SelectorQuery("xpath", "//input")._parameterized_xpath()
+        assert xpath == "//input"
+        assert variables == {}
+
+    def test_matches_the_same_elements_as_literal_queries(self, string):
+        assert string.has_field("Email")
+        assert string.has_field("email", placeholder="it's you")
+        assert string.has_field("Name", name="name")
+        assert not string.has_field("Name", name="email")
+        assert not string.has_field("Phone")
+
+
+class TestXPath:
+    def test_memoizes_the_rendered_query(self):
+        query = SelectorQuery("field", "Email")
+        assert query.xpath() is query.xpath()
+        assert query.xpath(exact=True) != query.xpath(exact=False)
+
+    def test_shares_rendered_queries_across_instances(self):
+        xpath1 = SelectorQuery("field", "Email", name="email").xpath()
+        xpath2 = SelectorQuery("field", "Email", name="email", visible=False).xpath()
+        assert xpath1 is xpath2
+
+    def test_distinguishes_filter_options(self):
+        xpath1 = SelectorQuery("field", "Email", name="email").xpath()
+        xpath2 = SelectorQuery("field", "Email", name="other").xpath()
+        assert xpath1 != xpath2
+
+    def test_distinguishes_aria_label_matching(self):
+        xpath1 = SelectorQuery("field", "Email").xpath()
+        capybara.enable_aria_label = True
+        try:
+            xpath2 = SelectorQuery("field", "Email").xpath()
+        finally:
+            capybara.enable_aria_label = False
+        assert xpath1 != xpath2
+        assert "aria-label" in xpath2